@@ -16,16 +16,250 @@
 
 import os
 import re
-import shutil
+import stat
 
-def replace_in_file(filename, original, replacement):
-    try:
-        with open(filename, 'r') as infile:
-            content = infile.read()
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_JAVA_KEYWORDS = frozenset({
+    'abstract', 'assert', 'boolean', 'break', 'byte', 'case',
+    'catch', 'char', 'class', 'const', 'continue', 'default',
+    'do', 'double', 'else', 'enum', 'extends', 'final',
+    'finally', 'float', 'for', 'goto', 'if', 'implements',
+    'import', 'instanceof', 'int', 'interface', 'long', 'native',
+    'new', 'package', 'private', 'protected', 'public', 'return',
+    'short', 'static', 'strictfp', 'super', 'switch', 'synchronized',
+    'this', 'throw', 'throws', 'transient', 'try', 'void',
+    'volatile', 'while', 'true', 'false', 'null', '_'
+})
+
+_REQUIRED_PATHS = [
+    os.path.join("Ambassador", "Ambassador.iml"),
+    os.path.join("Ambassador", "META-INF", "MANIFEST.MF"),
+    os.path.join("Ambassador", ".idea", "modules.xml"),
+    os.path.join("Ambassador", ".idea", "scopes", "web_ambassador.xml"),
+    os.path.join(
+        "Ambassador", ".idea", "artifacts",
+        "ambassador_template.xml"
+    ),
+    os.path.join(
+        "Ambassador", ".idea", "runConfigurations",
+        "ambassador_template.xml"
+    )
+]
+
+_REMOVED_PATHS = [
+    os.path.join("Ambassador", ".git"),
+    os.path.join("Ambassador", "docs"),
+    os.path.join("Ambassador", "misc"),
+    os.path.join("Ambassador", "src", "com"),
+    os.path.join("Ambassador", ".gitignore"),
+    os.path.join("Ambassador", ".gitattributes"),
+    os.path.join("Ambassador", "Doxyfile"),
+    os.path.join("Ambassador", "README.md"),
+    os.path.join("Ambassador", ".idea", "vcs.xml")
+]
+
+_MANIFEST_KEYS = (b"com.example.app.WebApplication",)
+_ARTIFACT_KEYS = (
+    b"ambassador-template",
+    b"ambassador_template",
+    b"Ambassador"
+)
+_RUN_CONFIG_KEYS = (
+    b"ambassador-template",
+    b"Ambassador",
+    b"com.example.app.WebApplication"
+)
+_SCOPE_KEYS = (b"com.example.app",)
+_MODULE_KEYS = (b"Ambassador",)
+
+def compile_tokens(keys):
+    return re.compile(b'|'.join(
+        re.escape(key) for key in
+        sorted(keys, key=len, reverse=True)
+    ))
+
+def token_map(keys, values):
+    return {key: values[key] for key in keys}
+
+_MANIFEST_PAT = compile_tokens(_MANIFEST_KEYS)
+_ARTIFACT_PAT = compile_tokens(_ARTIFACT_KEYS)
+_RUN_CONFIG_PAT = compile_tokens(_RUN_CONFIG_KEYS)
+_SCOPE_PAT = compile_tokens(_SCOPE_KEYS)
+_MODULE_PAT = compile_tokens(_MODULE_KEYS)
+
+_MAIN_TMPL = r'''package {pkg};
+
+import {pkg}.controllers.DateTime;
+import {pkg}.controllers.HomeController;
+
+import web.ambassador.core.Kernel;
+import java.io.IOException;
+
+public class {cls} {{
+    public static void main(String[] args) {{
+        try(Kernel framework = new Kernel(8080)) {{
+            framework.setupShutdownHook(
+                ()-> System.out.println("Server stopped successfully!"),
+                ()-> System.out.println("Cannot shutdown server!")
+            );
+
+            framework.registerController(HomeController.class);
+            framework.registerController(DateTime.class);
+
+            framework.setMaxThreads(Runtime.getRuntime().availableProcessors() * 2);
+            framework.start();
+        }}
+        catch(IOException e) {{
+            System.err.println("Failed to start server: " + e.getMessage());
+            System.exit(1);
+        }}
+        catch(Exception e) {{
+            System.err.println("Unexpected error: " + e.getMessage());
+            System.exit(1);
+        }}
+    }}
+}}
+'''
+
+_HOME_TMPL = r'''package {pkg}.controllers;
 
-        updated_content = content.replace(original, replacement)
-        with open(filename, 'w') as outfile:
-            outfile.write(updated_content)
+import web.ambassador.annotations.Controller;
+import web.ambassador.annotations.Method;
+import web.ambassador.db.DatabaseManager;
+import web.ambassador.http.Request;
+import web.ambassador.http.Response;
+import web.ambassador.view.Component;
+import web.ambassador.view.Dom;
+import web.ambassador.view.ViewContent;
+
+@Controller
+public class HomeController implements Component {{
+    @Override
+    @Method
+    public ViewContent index(Request request, Response response, DatabaseManager dbManager) {{
+        return Dom.createPage(
+            Dom.head(
+                Dom.title("Your Ambassador homepage!"),
+                Dom.stylesheet("assets/styles/bootstrap.min.css")
+            ),
+            Dom.body(
+                Dom.br(),
+                Dom.div(
+                    Dom.img()
+                        .src("assets/images/logo.png")
+                        .attr("alt", "Logo")
+                        .attr("width", "300")
+                        .addClass("mt-4"),
+                    Dom.h2("Welcome to your Ambassador homepage!")
+                        .addClass("mt-4"),
+                    Dom.p(
+                        Dom.noTag("Server date and time is: "),
+                        Dom.span().id("datetime")
+                    ),
+                    Dom.div(
+                        Dom.a(
+                            "https://nthnn.github.io/Ambassador",
+                            "Learn More",
+                            "_blank"
+                        ).addClass(
+                            "btn",
+                            "btn-primary",
+                            "d-block-inline",
+                            "mx-1"
+                        ),
+                        Dom.a(
+                            "https://github.com/nthnn/Ambassador",
+                            "GitHub",
+                            "_blank"
+                        ).addClass(
+                            "btn",
+                            "btn-primary",
+                            "d-block-inline",
+                            "mx-1"
+                        )
+                    ),
+                    Dom.script(
+                        "javascript",
+                        """
+                        const fetchDatetime = async ()=> {{
+                            const response = await fetch('/datetime', {{
+                                method: 'POST',
+                                headers: {{
+                                    'Content-Type': 'application/json'
+                                }},
+                                body: JSON.stringify({{}})
+                            }});
+
+                            if(!response.ok)
+                                return;
+
+                            const data = await response.json();
+                            const datetimeElement = document.getElementById('datetime');
+
+                            datetimeElement.textContent = data.datetime || "No data received";
+                        }};
+
+                        fetchDatetime();
+                        setInterval(fetchDatetime, 1000);
+                        """
+                    )
+                ).attr("align", "center")
+                    .addClass("mt-4")
+            )
+        );
+    }}
+}}
+'''
+
+_DATETIME_TMPL = r'''package {pkg}.controllers;
+
+import web.ambassador.annotations.Controller;
+import web.ambassador.annotations.Method;
+import web.ambassador.db.DatabaseManager;
+import web.ambassador.enums.HttpStatusCode;
+import web.ambassador.enums.MethodType;
+import web.ambassador.http.Request;
+import web.ambassador.http.Response;
+import web.ambassador.view.Component;
+import web.ambassador.view.EmptyView;
+import web.ambassador.view.JsonContent;
+import web.ambassador.view.ViewContent;
+
+import java.util.Date;
+import java.util.HashMap;
+import java.util.Map;
+
+@Controller(path="/datetime")
+public class DateTime implements Component {{
+    @Override
+    @Method(MethodType.POST)
+    public ViewContent index(Request request, Response response, DatabaseManager dbManager) {{
+        Map<String, Object> data = new HashMap<>();
+        data.put("datetime", new Date());
+
+        return JsonContent.fromMap(data);
+    }}
+
+    @Method
+    public ViewContent redirect(Request request, Response response, DatabaseManager dbManager) {{
+        response.setStatusCode(HttpStatusCode.PERMANENT_REDIRECT);
+        response.getHeaders().put("Location", "/");
+
+        return new EmptyView();
+    }}
+}}
+'''
+
+def replace_in_file(filename, pattern, mapping, count=0):
+    try:
+        path = Path(filename)
+        path.write_bytes(pattern.sub(
+            lambda match: mapping[match.group()],
+            path.read_bytes(),
+            count=count
+        ))
 
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
@@ -35,11 +269,56 @@ def replace_in_file(filename, original, replacement):
         print(f"An error occurred: {e}")
         exit()
 
+def write_source(filename, content):
+    with open(filename, "wb", buffering=1 << 17) as outfile:
+        outfile.write(content.replace("\n", "\r\n").encode("utf-8"))
+
+def remove_tree(path):
+    with os.scandir(path) as scanner:
+        entries = list(scanner)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            remove_tree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    os.rmdir(path)
+
+def remove_paths(paths):
+    for path in paths:
+        if stat.S_ISDIR(os.lstat(path).st_mode):
+            remove_tree(path)
+        else:
+            os.unlink(path)
+
+def is_valid_java_identifier(name):
+    return (
+        name.isascii() and
+        name.isidentifier() and
+        name not in _JAVA_KEYWORDS
+    )
+
 def is_valid_java_class_name(name):
-    return re.fullmatch(r'[A-Z][a-zA-Z0-9_]*', name) is not None
+    return (
+        name != "" and
+        name[0].isupper() and
+        is_valid_java_identifier(name)
+    )
 
 def is_valid_java_package(package):
-    return re.fullmatch(r'([a-z][a-zA-Z0-9_]*)(\.[a-z][a-zA-Z0-9_]*)*', package) is not None
+    if not package:
+        return False
+
+    for fragment in package.split('.'):
+        if (
+            not fragment or
+            not fragment[0].islower() or
+            not is_valid_java_identifier(fragment)
+        ):
+            return False
+
+    return True
 
 project_name = input("Project name: ")
 if not is_valid_java_class_name(project_name):
@@ -54,312 +333,99 @@ package_name = input("Project package: ")
 if not is_valid_java_package(package_name):
     print(
         "Invalid package name. It must start "
-        "with a lowercase letter and be "
-        "dot-separated."
+        "with a lowercase letter, be dot-separated, "
+        "and not use Java reserved keywords."
     )
     exit()
 
-shutil.rmtree(os.path.join("Ambassador", ".git"))
-shutil.rmtree(os.path.join("Ambassador", "docs"))
-shutil.rmtree(os.path.join("Ambassador", "misc"))
-shutil.rmtree(os.path.join("Ambassador", "src", "com"))
+for required_path in _REQUIRED_PATHS + _REMOVED_PATHS:
+    if not os.path.lexists(required_path):
+        print(f"Error: {required_path} not found.")
+        exit()
+
+if project_name != "Ambassador" and os.path.exists(project_name):
+    print(f"Error: {project_name} already exists.")
+    exit()
 
-os.remove(os.path.join("Ambassador", ".gitignore"))
-os.remove(os.path.join("Ambassador", ".gitattributes"))
-os.remove(os.path.join("Ambassador", "Doxyfile"))
-os.remove(os.path.join("Ambassador", "README.md"))
-os.remove(os.path.join("Ambassador", ".idea", "vcs.xml"))
+remove_paths(_REMOVED_PATHS)
 # os.remove(os.path.join("Ambassador", "setup.py"))
 
-shutil.move("Ambassador", project_name)
-shutil.move(
+os.rename("Ambassador", project_name)
+
+idea_path = os.path.join(project_name, ".idea")
+artifacts_xml = os.path.join(
+    idea_path, "artifacts",
+    project_name + ".xml"
+)
+runconfig_xml = os.path.join(
+    idea_path, "runConfigurations",
+    project_name + ".xml"
+)
+manifest_path = os.path.join(project_name, "META-INF", "MANIFEST.MF")
+modules_xml = os.path.join(idea_path, "modules.xml")
+scopes_xml = os.path.join(idea_path, "scopes", "web_ambassador.xml")
+
+os.replace(
     os.path.join(project_name, "Ambassador.iml"),
     os.path.join(project_name, project_name + ".iml")
 )
-shutil.move(
+os.replace(
     os.path.join(
-        project_name, ".idea", "artifacts",
+        idea_path, "artifacts",
         "ambassador_template.xml"
     ),
-    os.path.join(
-        project_name, ".idea", "artifacts",
-        project_name + ".xml"
-    )
+    artifacts_xml
 )
-shutil.move(
+os.replace(
     os.path.join(
-        project_name, ".idea",
-        "runConfigurations",
+        idea_path, "runConfigurations",
         "ambassador_template.xml"
     ),
-    os.path.join(
-        project_name, ".idea",
-        "runConfigurations",
-        project_name + ".xml"
-    )
+    runconfig_xml
 )
 
 folder_path = os.path.join(
     project_name,
     "src",
-    package_name
-).replace('.', os.sep)
-os.makedirs(
-    folder_path,
-    exist_ok=True
+    *package_name.split('.')
 )
+controllers_path = os.path.join(folder_path, "controllers")
 os.makedirs(
-    os.path.join(folder_path, "controllers"),
+    controllers_path,
     exist_ok=True
 )
 
-replace_in_file(
-    os.path.join(project_name, "META-INF", "MANIFEST.MF"),
-    "com.example.app.WebApplication",
-    package_name + "." + project_name
-)
+token_values = {
+    b"ambassador-template": project_name.encode('utf-8'),
+    b"ambassador_template": project_name.encode('utf-8'),
+    b"Ambassador": project_name.encode('utf-8'),
+    b"com.example.app.WebApplication":
+        (package_name + "." + project_name).encode('utf-8'),
+    b"com.example.app": package_name.encode('utf-8')
+}
 
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "artifacts",
-        project_name + ".xml"
-    ),
-    "ambassador-template",
-    project_name
-)
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "artifacts",
-        project_name + ".xml"
-    ),
-    "ambassador_template",
-    project_name
-)
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "artifacts",
-        project_name + ".xml"
-    ),
-    "Ambassador",
-    project_name
-)
+edits = [
+    (manifest_path, _MANIFEST_PAT, token_map(_MANIFEST_KEYS, token_values), 1),
+    (artifacts_xml, _ARTIFACT_PAT, token_map(_ARTIFACT_KEYS, token_values)),
+    (runconfig_xml, _RUN_CONFIG_PAT, token_map(_RUN_CONFIG_KEYS, token_values)),
+    (scopes_xml, _SCOPE_PAT, token_map(_SCOPE_KEYS, token_values)),
+    (modules_xml, _MODULE_PAT, token_map(_MODULE_KEYS, token_values))
+]
 
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "runConfigurations",
-        project_name + ".xml"
-    ),
-    "ambassador-template",
-    project_name
-)
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "runConfigurations",
-        project_name + ".xml"
-    ),
-    "Ambassador",
-    project_name
-)
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "runConfigurations",
-        project_name + ".xml"
-    ),
-    "com.example.app.WebApplication",
-    package_name + "." + project_name
-)
+with ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(lambda edit: replace_in_file(*edit), edits))
 
-replace_in_file(
-    os.path.join(
-        project_name, ".idea", "scopes",
-        "web_ambassador.xml"
-    ),
-    "com.example.app",
-    package_name
+write_source(
+    os.path.join(folder_path, project_name + ".java"),
+    _MAIN_TMPL.format(pkg=package_name, cls=project_name)
 )
 
-replace_in_file(
-    os.path.join(project_name, ".idea", "modules.xml"),
-    "Ambassador", project_name
+write_source(
+    os.path.join(controllers_path, "HomeController.java"),
+    _HOME_TMPL.format(pkg=package_name)
 )
 
-with open(
-    os.path.join(folder_path, project_name + ".java"
-), "w") as main:
-    main.write(
-        "package " + package_name + ";\r\n"
-        "\r\n"
-        "import " + package_name + ".controllers.DateTime;\r\n"
-        "import " + package_name + ".controllers.HomeController;\r\n"
-        "\r\n"
-        "import web.ambassador.core.Kernel;\r\n"
-        "import java.io.IOException;\r\n"
-        "\r\n"
-        "public class " + project_name + " {\r\n"
-        "    public static void main(String[] args) {\r\n"
-        "        try(Kernel framework = new Kernel(8080)) {\r\n"
-        "            framework.setupShutdownHook(\r\n"
-        "                ()-> System.out.println(\"Server stopped successfully!\"),\r\n"
-        "                ()-> System.out.println(\"Cannot shutdown server!\")\r\n"
-        "            );\r\n"
-        "\r\n"
-        "            framework.registerController(HomeController.class);\r\n"
-        "            framework.registerController(DateTime.class);\r\n"
-        "\r\n"
-        "            framework.setMaxThreads(Runtime.getRuntime().availableProcessors() * 2);\r\n"
-        "            framework.start();\r\n"
-        "        }\r\n"
-        "        catch(IOException e) {\r\n"
-        "            System.err.println(\"Failed to start server: \" + e.getMessage());\r\n"
-        "            System.exit(1);\r\n"
-        "        }\r\n"
-        "        catch(Exception e) {\r\n"
-        "            System.err.println(\"Unexpected error: \" + e.getMessage());\r\n"
-        "            System.exit(1);\r\n"
-        "        }\r\n"
-        "    }\r\n"
-        "}\r\n"
-    )
-
-with open(
-    os.path.join(
-        folder_path,
-        "controllers",
-        "HomeController.java"
-), "w") as main:
-    main.write(
-        "package " + package_name + ".controllers;\r\n"
-        "\r\n"
-        "import web.ambassador.annotations.Controller;\r\n"
-        "import web.ambassador.annotations.Method;\r\n"
-        "import web.ambassador.db.DatabaseManager;\r\n"
-        "import web.ambassador.http.Request;\r\n"
-        "import web.ambassador.http.Response;\r\n"
-        "import web.ambassador.view.Component;\r\n"
-        "import web.ambassador.view.Dom;\r\n"
-        "import web.ambassador.view.ViewContent;\r\n"
-        "\r\n"
-        "@Controller\r\n"
-        "public class HomeController implements Component {\r\n"
-        "    @Override\r\n"
-        "    @Method\r\n"
-        "    public ViewContent index(Request request, Response response, DatabaseManager dbManager) {\r\n"
-        "        return Dom.createPage(\r\n"
-        "            Dom.head(\r\n"
-        "                Dom.title(\"Your Ambassador homepage!\"),\r\n"
-        "                Dom.stylesheet(\"assets/styles/bootstrap.min.css\")\r\n"
-        "            ),\r\n"
-        "            Dom.body(\r\n"
-        "                Dom.br(),\r\n"
-        "                Dom.div(\r\n"
-        "                    Dom.img()\r\n"
-        "                        .src(\"assets/images/logo.png\")\r\n"
-        "                        .attr(\"alt\", \"Logo\")\r\n"
-        "                        .attr(\"width\", \"300\")\r\n"
-        "                        .addClass(\"mt-4\"),\r\n"
-        "                    Dom.h2(\"Welcome to your Ambassador homepage!\")\r\n"
-        "                        .addClass(\"mt-4\"),\r\n"
-        "                    Dom.p(\r\n"
-        "                        Dom.noTag(\"Server date and time is: \"),\r\n"
-        "                        Dom.span().id(\"datetime\")\r\n"
-        "                    ),\r\n"
-        "                    Dom.div(\r\n"
-        "                        Dom.a(\r\n"
-        "                            \"https://nthnn.github.io/Ambassador\",\r\n"
-        "                            \"Learn More\",\r\n"
-        "                            \"_blank\"\r\n"
-        "                        ).addClass(\r\n"
-        "                            \"btn\",\r\n"
-        "                            \"btn-primary\",\r\n"
-        "                            \"d-block-inline\",\r\n"
-        "                            \"mx-1\"\r\n"
-        "                        ),\r\n"
-        "                        Dom.a(\r\n"
-        "                            \"https://github.com/nthnn/Ambassador\",\r\n"
-        "                            \"GitHub\",\r\n"
-        "                            \"_blank\"\r\n"
-        "                        ).addClass(\r\n"
-        "                            \"btn\",\r\n"
-        "                            \"btn-primary\",\r\n"
-        "                            \"d-block-inline\",\r\n"
-        "                            \"mx-1\"\r\n"
-        "                        )\r\n"
-        "                    ),\r\n"
-        "                    Dom.script(\r\n"
-        "                        \"javascript\",\r\n"
-        "                        \"\"\"\r\n"
-        "                        const fetchDatetime = async ()=> {\r\n"
-        "                            const response = await fetch('/datetime', {\r\n"
-        "                                method: 'POST',\r\n"
-        "                                headers: {\r\n"
-        "                                    'Content-Type': 'application/json'\r\n"
-        "                                },\r\n"
-        "                                body: JSON.stringify({})\r\n"
-        "                            });\r\n"
-        "\r\n"
-        "                            if(!response.ok)\r\n"
-        "                                return;\r\n"
-        "\r\n"
-        "                            const data = await response.json();\r\n"
-        "                            const datetimeElement = document.getElementById('datetime');\r\n"
-        "\r\n"
-        "                            datetimeElement.textContent = data.datetime || \"No data received\";\r\n"
-        "                        };\r\n"
-        "\r\n"
-        "                        fetchDatetime();\r\n"
-        "                        setInterval(fetchDatetime, 1000);\r\n"
-        "                        \"\"\"\r\n"
-        "                    )\r\n"
-        "                ).attr(\"align\", \"center\")\r\n"
-        "                    .addClass(\"mt-4\")\r\n"
-        "            )\r\n"
-        "        );\r\n"
-        "    }\r\n"
-        "}\r\n"
-    )
-
-with open(
-    os.path.join(
-        folder_path,
-        "controllers",
-        "DateTime.java"
-), "w") as main:
-    main.write(
-        "package " + package_name + ".controllers;\r\n"
-        "\r\n"
-        "import web.ambassador.annotations.Controller;\r\n"
-        "import web.ambassador.annotations.Method;\r\n"
-        "import web.ambassador.db.DatabaseManager;\r\n"
-        "import web.ambassador.enums.HttpStatusCode;\r\n"
-        "import web.ambassador.enums.MethodType;\r\n"
-        "import web.ambassador.http.Request;\r\n"
-        "import web.ambassador.http.Response;\r\n"
-        "import web.ambassador.view.Component;\r\n"
-        "import web.ambassador.view.EmptyView;\r\n"
-        "import web.ambassador.view.JsonContent;\r\n"
-        "import web.ambassador.view.ViewContent;\r\n"
-        "\r\n"
-        "import java.util.Date;\r\n"
-        "import java.util.HashMap;\r\n"
-        "import java.util.Map;\r\n"
-        "\r\n"
-        "@Controller(path=\"/datetime\")\r\n"
-        "public class DateTime implements Component {\r\n"
-        "    @Override\r\n"
-        "    @Method(MethodType.POST)\r\n"
-        "    public ViewContent index(Request request, Response response, DatabaseManager dbManager) {\r\n"
-        "        Map<String, Object> data = new HashMap<>();\r\n"
-        "        data.put(\"datetime\", new Date());\r\n"
-        "\r\n"
-        "        return JsonContent.fromMap(data);\r\n"
-        "    }\r\n"
-        "\r\n"
-        "    @Method\r\n"
-        "    public ViewContent redirect(Request request, Response response, DatabaseManager dbManager) {\r\n"
-        "        response.setStatusCode(HttpStatusCode.PERMANENT_REDIRECT);\r\n"
-        "        response.getHeaders().put(\"Location\", \"/\");\r\n"
-        "\r\n"
-        "        return new EmptyView();\r\n"
-        "    }\r\n"
-        "}\r\n"
-    )
+write_source(
+    os.path.join(controllers_path, "DateTime.java"),
+    _DATETIME_TMPL.format(pkg=package_name)
+)